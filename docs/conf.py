@@ -33,6 +33,7 @@ release = '0.1.0'
 # -- General configuration ----------------------------
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+nitpicky = False
 
 
 
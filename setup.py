@@ -1,13 +1,14 @@
 # setup.py
 from setuptools import setup, Extension
 from Cython.Build import cythonize
+import os
 import subprocess
 import sys
 
-def get_pkg_config(package, option):
+def get_pkg_config(package, *options):
     try:
         result = subprocess.run(
-            ['pkg-config', option, package],
+            ['pkg-config', *options, package],
             capture_output=True,
             text=True,
             check=True
@@ -20,19 +21,61 @@ def get_pkg_config(package, option):
         print("Error: pkg-config not found.")
         sys.exit(1)
 
+def find_static_library(name, library_dirs):
+    for library_dir in library_dirs:
+        path = os.path.join(library_dir, f'lib{name}.a')
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+    print(f"Error: lib{name}.a not found in {library_dirs}")
+    sys.exit(1)
+
+# Set PYCFFTABLES_STATIC=1 to bundle libcfftables.a into the extension instead of linking the shared library
+static = os.environ.get('PYCFFTABLES_STATIC') == '1'
+
 # Get flags for libcfftables
-cflags = get_pkg_config('libcfftables', '--cflags')
-libs = get_pkg_config('libcfftables', '--libs')
+if static:
+    flags = get_pkg_config('libcfftables', '--static', '--cflags', '--libs')
+else:
+    flags = get_pkg_config('libcfftables', '--cflags', '--libs')
 
 # Parse the flags into setuptools format
-include_dirs = [flag[2:] for flag in cflags if flag.startswith('-I')]
-library_dirs = [flag[2:] for flag in libs if flag.startswith('-L')]
-libraries = [flag[2:] for flag in libs if flag.startswith('-l')]
+include_dirs = [flag[2:] for flag in flags if flag.startswith('-I')]
+library_dirs = [flag[2:] for flag in flags if flag.startswith('-L')]
+libraries = [flag[2:] for flag in flags if flag.startswith('-l')]
+extra_objects = []
+
+if static:
+    # pkg-config leaves out -L for system directories, so also look in the .pc file's libdir
+    libdir = get_pkg_config('libcfftables', '--variable=libdir')
+    extra_objects.append(find_static_library('cfftables', library_dirs + libdir))
+    libraries = [lib for lib in libraries if lib != 'cfftables']
+    # libcfftables.pc may not list its own dependencies under Libs.private
+    for lib in ('flint', 'mpfr', 'gmp'):
+        if lib not in libraries:
+            libraries.append(lib)
 
 print(f"Found libcfftables:")
 print(f"  Include dirs: {include_dirs}")
 print(f"  Library dirs: {library_dirs}")
 print(f"  Libraries: {libraries}")
+if static:
+    print(f"  Static objects: {extra_objects}")
+
+# Set PYCFFTABLES_DEBUG=1 to build with bounds and negative index checks enabled
+debug = os.environ.get('PYCFFTABLES_DEBUG') == '1'
+
+# Optimization flags. Set PYCFFTABLES_PORTABLE=1 when building wheels for other machines,
+# or PYCFFTABLES_MARCH to target a specific baseline such as x86-64-v3
+extra_compile_args = ['-O3', '-flto', '-fvisibility=hidden']
+extra_link_args = ['-flto']
+march = os.environ.get('PYCFFTABLES_MARCH')
+if march:
+    extra_compile_args.append(f'-march={march}')
+elif os.environ.get('PYCFFTABLES_PORTABLE') != '1':
+    extra_compile_args.append('-march=native')
+if sys.platform.startswith('linux'):
+    extra_compile_args.append('-fno-plt')
+    extra_link_args += ['-Wl,-O1', '-Wl,--as-needed']
 
 # Define the Cython extension
 extensions = [
@@ -42,6 +85,9 @@ extensions = [
         include_dirs=include_dirs,
         library_dirs=library_dirs,
         libraries=libraries,
+        extra_objects=extra_objects,
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
         language="c",
     )
 ]
@@ -51,11 +97,16 @@ setup(
         extensions,
         compiler_directives={
             'language_level': "3",
-            'boundscheck': False,
-            'wraparound': False,
+            'boundscheck': debug,
+            'wraparound': debug,
+            'initializedcheck': False,
+            'cdivision': True,
+            'infer_types': True,
             'embedsignature': True,
             'binding': True,
         },
-        annotate = True,
+        # Set PYCFFTABLES_ANNOTATE=1 to write the _lib.html annotation report
+        annotate=os.environ.get('PYCFFTABLES_ANNOTATE') == '1',
+        nthreads=os.cpu_count() or 0,
     ),
 )
\ No newline at end of file
@@ -1,6 +1,6 @@
 from libc.stdio cimport FILE
 
-cdef extern from "libcfftables/libcfftables.h":
+cdef extern from "libcfftables/libcfftables.h" nogil:
     ctypedef struct cff_t:
         pass
     cff_t* cff_alloc(int d, int t, long long n)
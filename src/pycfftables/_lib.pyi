@@ -28,9 +28,16 @@ class CFF:
     @property
     def pools(self) -> PoolsView: ...
 
+    @property
+    def row_weights(self) -> memoryview: ...
+
+    @property
+    def col_weights(self) -> memoryview: ...
+
     def __getitem__(self, key: tuple[int, int]) -> int: ...
     def __setitem__(self, key: tuple[int, int], value: int) -> None: ...
     def verify(self) -> bool: ...
+    def to_string(self) -> str: ...
     def write_to_filepath(self, filepath: str) -> None: ...
     def copy(self) -> CFF: ...
 
@@ -74,11 +81,13 @@ class ColsView:
     def __len__(self) -> int: ...
     def __getitem__(self, c: int) -> tuple[int, ...]: ...
     def __iter__(self) -> Iterator[tuple[int, ...]]: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
 
 class RowsView:
     def __len__(self) -> int: ...
     def __getitem__(self, r: int) -> tuple[int, ...]: ...
     def __iter__(self) -> Iterator[tuple[int, ...]]: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
 
 class PoolsView:
     def __len__(self) -> int: ...
@@ -1,7 +1,12 @@
 from pycfftables._lib cimport *
 from libc.stdio cimport FILE, fopen, fclose, fdopen, fflush
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
 from cpython.object cimport PyObject
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_ND, PyBUF_STRIDES
+from cpython cimport array
 
+import array
 from math import comb, floor
 from os import dup as os_dup, close as os_close
 from typing import Iterator
@@ -68,6 +73,10 @@ cdef class CFF:
     cdef int _t
     cdef long long _n
 
+    # lazily computed row and column weights, reset whenever the matrix changes
+    cdef array.array _row_weights
+    cdef array.array _col_weights
+
     def __cinit__(self):
         self._c_cff = NULL
 
@@ -100,6 +109,8 @@ cdef class CFF:
         self._d = cff_get_d(self._c_cff)
         self._t = cff_get_t(self._c_cff)
         self._n = cff_get_n(self._c_cff)
+        self._row_weights = None
+        self._col_weights = None
 
     cdef void _reduce_cff_n(self, long long new_n):
         """
@@ -129,13 +140,14 @@ cdef class CFF:
         """
         if self._c_cff == NULL:
             raise ValueError('CFF not initialized')
-        return cff_get_d(self._c_cff)
+        return self._d
 
     @d.setter
     def d(self, int value):
         if self._c_cff == NULL:
             raise ValueError('CFF not initialized')
         cff_set_d(self._c_cff, value)
+        self._d = cff_get_d(self._c_cff)
 
     @property
     def t(self):
@@ -157,7 +169,7 @@ cdef class CFF:
         """
         if self._c_cff == NULL:
             raise ValueError('CFF not initialized')
-        return cff_get_t(self._c_cff)
+        return self._t
 
     @property
     def n(self):
@@ -179,7 +191,7 @@ cdef class CFF:
         """
         if self._c_cff == NULL:
             raise ValueError('CFF not initialized')
-        return cff_get_n(self._c_cff)
+        return self._n
 
     @property
     def shape(self):
@@ -201,7 +213,7 @@ cdef class CFF:
         """
         if self._c_cff == NULL:
             raise ValueError('CFF not initialized')
-        return (self.t, self.n)
+        return (self._t, self._n)
 
     @property
     def rows(self):
@@ -341,6 +353,72 @@ cdef class CFF:
         """
         return PoolsView(self)
 
+    @property
+    def row_weights(self):
+        """
+        The number of 1s in each row of the CFF.
+
+        The weights are counted once with popcount over the bit field and cached
+        until the CFF is modified. Element i equals ``len(cff.pools[i])``.
+
+        Example
+        -------
+        >>> cff = CFF.sts(9)
+        >>> cff.row_weights.tolist()
+        [4, 4, 4, 4, 4, 4, 4, 4, 4]
+
+        Raises
+        ------
+        ValueError
+            If the CFF has not been initialized
+
+        Returns
+        -------
+        memoryview
+            A read-only memoryview of t unsigned ints
+        """
+        cdef array.array weights
+        if self._c_cff == NULL:
+            raise ValueError('CFF not initialized')
+        if self._row_weights is None:
+            weights = array.clone(_uint_array_template, self._t, zero=True)
+            _fill_row_weights(self._matrix, self._t, self._n, self._row_pitch_bits, weights.data.as_uints)
+            self._row_weights = weights
+        return memoryview(self._row_weights).toreadonly()
+
+    @property
+    def col_weights(self):
+        """
+        The number of 1s in each column of the CFF.
+
+        The weights are counted once over the bit field and cached until the CFF
+        is modified. Element i equals ``len(cff.subsets[i])``.
+
+        Example
+        -------
+        >>> cff = CFF.sts(9)
+        >>> cff.col_weights.tolist()
+        [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3]
+
+        Raises
+        ------
+        ValueError
+            If the CFF has not been initialized
+
+        Returns
+        -------
+        memoryview
+            A read-only memoryview of n unsigned ints
+        """
+        cdef array.array weights
+        if self._c_cff == NULL:
+            raise ValueError('CFF not initialized')
+        if self._col_weights is None:
+            weights = array.clone(_uint_array_template, self._n, zero=True)
+            _fill_col_weights(self._matrix, self._t, self._n, self._row_pitch_bits, weights.data.as_uints)
+            self._col_weights = weights
+        return memoryview(self._col_weights).toreadonly()
+
     def __getitem__(self, key):
         """
         Get a matrix element using indexing syntax: cff[row, col].
@@ -407,6 +485,8 @@ cdef class CFF:
             if r < 0 or r >= self._t or c < 0 or c >= self._n:
                 raise IndexError('Indexed the CFF out of bounds')
             cff_set_matrix_value(self._c_cff, r, c, value)
+            self._row_weights = None
+            self._col_weights = None
         else:
             raise TypeError('CFF indexing requires a tuple of (row, col)')
 
@@ -416,18 +496,59 @@ cdef class CFF:
         return f'{self.d}-CFF({self.t},{self.n})'
 
     def __str__(self):
+        return self.to_string()
+
+    def to_string(self) -> str:
+        """
+        The CFF's incidence matrix as text, which is also what ``str(cff)`` and ``print(cff)`` give.
+
+        The first line is the CFF's parameters, followed by one line per row with
+        ``1`` for a cell containing a 1 and ``-`` for a cell containing a 0.
+        The text is built in a single pass over the bit field.
+
+        Examples
+        --------
+        >>> cff = CFF.sperner(6)
+        >>> print(cff.to_string())
+        1-CFF(4,6):
+        1 1 1 - - -
+        1 - - 1 1 -
+        - 1 - 1 - 1
+        - - 1 - 1 1
+
+        Returns
+        -------
+        str
+            The CFF's parameters and incidence matrix
+        """
+        cdef Py_ssize_t r, c, bit_offset, pos = 0
+        cdef Py_ssize_t t = self._t
+        cdef Py_ssize_t n = self._n
+        cdef Py_ssize_t pitch = self._row_pitch_bits
+        cdef const unsigned char* data = self._matrix
+        cdef bytearray text
+        cdef unsigned char* chars
+
         if self._c_cff == NULL:
             return 'CFF(uninitialized)'
 
-        lines = [f'{self.d}-CFF({self.t},{self.n}):']
-        for r in range(self.t):
-            row = []
-            for c in range(self.n):
-                value = self[r, c]
-                row.append('1' if value else '-')
-            lines.append(' '.join(row))
+        header = f'{self._d}-CFF({t},{n}):'
+        if t == 0 or n == 0:
+            return '\n'.join([header] + [''] * t)
+
+        # every cell is a character followed by a space, or by a newline at the end of a row
+        text = bytearray(2 * t * n)
+        chars = text
+        for r in range(t):
+            bit_offset = r * pitch
+            for c in range(n):
+                chars[pos] = b'1' if (data[bit_offset >> 3] >> (bit_offset & 7)) & 1 else b'-'
+                chars[pos + 1] = b' '
+                pos += 2
+                bit_offset += 1
+            chars[pos - 1] = b'\n'
 
-        return '\n'.join(lines)
+        return header + '\n' + text[:pos - 1].decode('ascii')
 
     def verify(self) -> bool:
         """
@@ -449,7 +570,13 @@ cdef class CFF:
         bool
             True if the CFF is valid, false otherwise
         """
-        return bool(cff_verify(self._c_cff))
+        cdef bint valid
+        if self._c_cff == NULL:
+            raise ValueError('CFF not initialized')
+        # the whole check runs inside libcfftables, so the GIL isn't needed
+        with nogil:
+            valid = cff_verify(self._c_cff)
+        return valid
 
     def write_to_filepath(self, filepath) -> None:
         """
@@ -495,7 +622,8 @@ cdef class CFF:
             The newly copied CFF
         """
         cdef CFF dst = CFF.__new__(CFF)
-        dst._c_cff = cff_copy(self._c_cff)
+        with nogil:
+            dst._c_cff = cff_copy(self._c_cff)
         if dst._c_cff == NULL:
             raise MemoryError('Failed to copy CFF')
         dst._cache_layout()
@@ -531,7 +659,8 @@ cdef class CFF:
             The newly constructed CFF
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_alloc(d, t, n)
+        with nogil:
+            result._c_cff = cff_alloc(d, t, n)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize all zeros CFF')
         result._cache_layout()
@@ -560,7 +689,8 @@ cdef class CFF:
             The newly constructed CFF
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_identity(d, n)
+        with nogil:
+            result._c_cff = cff_identity(d, n)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF from identity matrix')
         result._cache_layout()
@@ -587,7 +717,8 @@ cdef class CFF:
             A 1-CFF(t = min{s : choose(s, s/2) >= n }, n)
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_sperner(n)
+        with nogil:
+            result._c_cff = cff_sperner(n)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize 1-CFF from Sperner system')
         result._cache_layout()
@@ -618,7 +749,8 @@ cdef class CFF:
         cdef CFF result = CFF.__new__(CFF)
         if not ((v % 6 == 3) or (v % 6 == 1)):
             raise ValueError('v parameter must be congruent to 1,3 mod 6 to create STS')
-        result._c_cff = cff_sts(v)
+        with nogil:
+            result._c_cff = cff_sts(v)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize 2-CFF from STS')
         result._cache_layout()
@@ -651,7 +783,8 @@ cdef class CFF:
             A ((m - 1) / (t + 1))-CFF(m*(p^exp), (p^exp)^t)
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_reed_solomon(p, exp, k, m)
+        with nogil:
+            result._c_cff = cff_reed_solomon(p, exp, k, m)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF from Reed-Solomon code')
         result._cache_layout()
@@ -686,7 +819,8 @@ cdef class CFF:
             A (((m-s) - 1) / ((t-s) + 1))-CFF((m-s)*(p^exp), (p^exp)^(t-s))
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_short_reed_solomon(p, exp, k, m, s)
+        with nogil:
+            result._c_cff = cff_short_reed_solomon(p, exp, k, m, s)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF from short Reed-Solomon code')
         result._cache_layout()
@@ -721,7 +855,8 @@ cdef class CFF:
             The newly constructed CFF
         """
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_porat_rothschild(p, exp, k, r, m)
+        with nogil:
+            result._c_cff = cff_porat_rothschild(p, exp, k, r, m)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF from Porat & Rothschild code')
         result._cache_layout()
@@ -751,7 +886,8 @@ cdef class CFF:
         """
         cdef CFF result = CFF.__new__(CFF)
         cdef CFF c_to_extend = to_extend
-        result._c_cff = cff_extend_by_one(c_to_extend._c_cff)
+        with nogil:
+            result._c_cff = cff_extend_by_one(c_to_extend._c_cff)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF using extend by one construction')
         result._cache_layout()
@@ -788,7 +924,8 @@ cdef class CFF:
         cdef int s = 0
         while comb(s,floor(s/2)) <= n:
             s += 1
-        result._c_cff = cff_doubling(c_to_double._c_cff, s)
+        with nogil:
+            result._c_cff = cff_doubling(c_to_double._c_cff, s)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF using additive construction')
         result._cache_layout()
@@ -820,7 +957,8 @@ cdef class CFF:
         cdef CFF result = CFF.__new__(CFF)
         cdef CFF c_left = left
         cdef CFF c_right = right
-        result._c_cff = cff_additive(c_left._c_cff, c_right._c_cff)
+        with nogil:
+            result._c_cff = cff_additive(c_left._c_cff, c_right._c_cff)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF using additive construction')
         result._cache_layout()
@@ -851,7 +989,8 @@ cdef class CFF:
         cdef CFF result = CFF.__new__(CFF)
         cdef CFF c_left = left
         cdef CFF c_right = right
-        result._c_cff = cff_kronecker(c_left._c_cff, c_right._c_cff)
+        with nogil:
+            result._c_cff = cff_kronecker(c_left._c_cff, c_right._c_cff)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF using Kronecker construction')
         result._cache_layout()
@@ -881,14 +1020,204 @@ cdef class CFF:
         cdef CFF c_outer = outer
         cdef CFF c_inner = inner
         cdef CFF c_bottom = bottom
-        result._c_cff = cff_optimized_kronecker(c_outer._c_cff, c_inner._c_cff, c_bottom._c_cff)
+        with nogil:
+            result._c_cff = cff_optimized_kronecker(c_outer._c_cff, c_inner._c_cff, c_bottom._c_cff)
         if result._c_cff == NULL:
             raise MemoryError('Failed to initialize CFF using optimized Kronecker construction')
         result._cache_layout()
         return result
 
 
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long x) nogil
+    int __builtin_ctzll(unsigned long long x) nogil
+    int __builtin_ctz(unsigned int x) nogil
+
+cdef array.array _uint_array_template = array.array('I', [])
+
+
+cdef inline unsigned long long _load_word(const unsigned char* row, Py_ssize_t word_idx, Py_ssize_t n) noexcept nogil:
+    """
+    Loads the 64 bits of a byte aligned row starting at column 64 * word_idx, so that
+    bit j of the result is column 64 * word_idx + j. The bytes are assembled in
+    little-endian order explicitly, which keeps this true on big-endian hosts.
+    Bytes past the end of the row are not read, and bits past column n (left over from
+    reducing n) are masked off.
+    """
+    cdef unsigned long long word = 0
+    cdef Py_ssize_t remaining = n - (word_idx << 6)
+    cdef Py_ssize_t num_bytes = 8 if remaining >= 64 else (remaining + 7) >> 3
+    cdef const unsigned char* src = row + (word_idx << 3)
+    cdef Py_ssize_t k
+    for k in range(num_bytes):
+        word |= (<unsigned long long>src[k]) << (k << 3)
+    if remaining < 64:
+        word &= (1ULL << remaining) - 1
+    return word
+
+
+cdef inline unsigned int _row_popcount(const unsigned char* row, Py_ssize_t n) noexcept nogil:
+    """
+    Counts the 1s in the first n bits of a byte aligned row, four 64-bit words per iteration.
+    The full words are copied with memcpy, since their popcount doesn't depend on byte order.
+    """
+    cdef Py_ssize_t full_words = n >> 6
+    cdef Py_ssize_t i = 0
+    cdef unsigned long long w0, w1, w2, w3
+    cdef unsigned int c0 = 0, c1 = 0, c2 = 0, c3 = 0
+
+    while i + 4 <= full_words:
+        memcpy(&w0, row + (i << 3), 8)
+        memcpy(&w1, row + ((i + 1) << 3), 8)
+        memcpy(&w2, row + ((i + 2) << 3), 8)
+        memcpy(&w3, row + ((i + 3) << 3), 8)
+        c0 += __builtin_popcountll(w0)
+        c1 += __builtin_popcountll(w1)
+        c2 += __builtin_popcountll(w2)
+        c3 += __builtin_popcountll(w3)
+        i += 4
+    while i << 6 < n:
+        c0 += __builtin_popcountll(_load_word(row, i, n))
+        i += 1
+    return c0 + c1 + c2 + c3
+
+
+cdef void _fill_row_weights(const unsigned char* data, Py_ssize_t t, Py_ssize_t n,
+                            Py_ssize_t pitch, unsigned int* weights) noexcept nogil:
+    """
+    Counts the 1s in each row. Rows that start on a byte boundary are counted 64 bits
+    at a time, ignoring any bits past column n that are left over from reducing n.
+    """
+    cdef Py_ssize_t r, c, bit_offset
+    cdef unsigned int count
+
+    for r in range(t):
+        if pitch & 7 == 0:
+            weights[r] = _row_popcount(data + r * (pitch >> 3), n)
+        else:
+            count = 0
+            bit_offset = r * pitch
+            for c in range(n):
+                count += (data[bit_offset >> 3] >> (bit_offset & 7)) & 1
+                bit_offset += 1
+            weights[r] = count
+
+
+cdef tuple _row_pool(const unsigned char* data, Py_ssize_t r, Py_ssize_t n, Py_ssize_t pitch):
+    """
+    Returns the columns holding a 1 in row r. Byte aligned rows are walked one 64-bit
+    word at a time, jumping straight to each set bit.
+    """
+    cdef Py_ssize_t c, i, bit_offset
+    cdef unsigned long long word
+    cdef const unsigned char* row
+    cdef list result = []
+
+    if pitch & 7 == 0:
+        row = data + r * (pitch >> 3)
+        i = 0
+        while i << 6 < n:
+            word = _load_word(row, i, n)
+            while word:
+                result.append((i << 6) + __builtin_ctzll(word))
+                word &= word - 1
+            i += 1
+    else:
+        bit_offset = r * pitch
+        for c in range(n):
+            if (data[bit_offset >> 3] >> (bit_offset & 7)) & 1:
+                result.append(c)
+            bit_offset += 1
+    return tuple(result)
+
+
+cdef void _fill_col_weights(const unsigned char* data, Py_ssize_t t, Py_ssize_t n,
+                            Py_ssize_t pitch, unsigned int* weights) noexcept nogil:
+    """
+    Counts the 1s in each column by walking the set bits of every row.
+    weights must be zeroed by the caller.
+    """
+    cdef Py_ssize_t r, c, i, bit_offset
+    cdef Py_ssize_t row_bytes = (n + 7) >> 3
+    cdef unsigned int byte
+    cdef const unsigned char* row
+
+    for r in range(t):
+        if pitch & 7 == 0:
+            row = data + r * (pitch >> 3)
+            for i in range(row_bytes):
+                byte = row[i]
+                if i == row_bytes - 1 and n & 7:
+                    byte &= (1 << (n & 7)) - 1
+                while byte:
+                    weights[(i << 3) + __builtin_ctz(byte)] += 1
+                    byte &= byte - 1
+        else:
+            bit_offset = r * pitch
+            for c in range(n):
+                weights[c] += (data[bit_offset >> 3] >> (bit_offset & 7)) & 1
+                bit_offset += 1
+
+
+cdef int _fill_matrix_buffer(object view, CFF cff, Py_buffer *buffer, int flags, bint transpose) except -1:
+    """
+    Fills a read-only Py_buffer with the unpacked incidence matrix of a CFF, one byte per cell.
+
+    The bit field is unpacked once into a newly allocated block, which also holds the
+    shape and strides and is freed by _release_matrix_buffer. The layout is (t, n) or,
+    if transpose is set, (n, t), and is C-contiguous in both cases.
+    """
+    cdef Py_ssize_t r, c, bit_offset
+    cdef Py_ssize_t t = cff._t
+    cdef Py_ssize_t n = cff._n
+    cdef Py_ssize_t pitch = cff._row_pitch_bits
+    cdef const unsigned char* data = cff._matrix
+    cdef Py_ssize_t* meta
+    cdef unsigned char* cells
+
+    if flags & PyBUF_WRITABLE:
+        raise BufferError('CFF views are read-only')
+
+    meta = <Py_ssize_t*>malloc(4 * sizeof(Py_ssize_t) + t * n)
+    if meta == NULL:
+        raise MemoryError('Failed to allocate CFF view buffer')
+    cells = <unsigned char*>(meta + 4)
+
+    for r in range(t):
+        bit_offset = r * pitch
+        for c in range(n):
+            if transpose:
+                cells[c * t + r] = (data[bit_offset >> 3] >> (bit_offset & 7)) & 1
+            else:
+                cells[r * n + c] = (data[bit_offset >> 3] >> (bit_offset & 7)) & 1
+            bit_offset += 1
+
+    meta[0] = n if transpose else t
+    meta[1] = t if transpose else n
+    meta[2] = meta[1]
+    meta[3] = 1
+
+    buffer.buf = cells
+    buffer.obj = view
+    buffer.len = t * n
+    buffer.readonly = 1
+    buffer.itemsize = 1
+    buffer.format = b'B'
+    buffer.ndim = 2 if (flags & PyBUF_ND) == PyBUF_ND else 1
+    buffer.shape = meta if (flags & PyBUF_ND) == PyBUF_ND else NULL
+    buffer.strides = meta + 2 if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+    buffer.suboffsets = NULL
+    buffer.internal = meta
+    return 0
+
+
+cdef void _release_matrix_buffer(Py_buffer *buffer) noexcept nogil:
+    free(buffer.internal)
+    buffer.internal = NULL
+
+
 cdef class ColsView:
+    """Columns of a CFF, also readable as a (n, t) byte array through the buffer protocol."""
     cdef CFF _cff
 
     def __cinit__(self, CFF cff):
@@ -919,24 +1248,42 @@ cdef class ColsView:
         return tuple(col)
 
     def __iter__(self) -> Iterator[tuple[int, ...]]:
-        cdef int r, c
-        cdef int bit_offset, byte_idx, bit_idx
-        cdef int t = self._cff._t
-        cdef int n = self._cff._n
-        cdef int pitch = self._cff._row_pitch_bits
+        cdef Py_ssize_t r, c, j, block, width
+        cdef Py_ssize_t t = self._cff._t
+        cdef Py_ssize_t n = self._cff._n
+        cdef Py_ssize_t pitch = self._cff._row_pitch_bits
         cdef const unsigned char* data = self._cff._matrix
+        cdef unsigned long long word
+        cdef bytearray block_cols
+        cdef unsigned char* cells
 
-        for c in range(n):
-            col = bytearray(t)
+        if pitch & 7:
+            for c in range(n):
+                yield self[c]
+            return
+
+        # Unpack 64 columns at a time with one pass down the rows,
+        # instead of one pass down the rows per column
+        block_cols = bytearray(64 * t)
+        cells = block_cols
+        for block in range(0, n, 64):
+            width = min(64, n - block)
             for r in range(t):
-                bit_offset = r * pitch + c
-                byte_idx = bit_offset >> 3
-                bit_idx = bit_offset & 7
-                col[r] = (data[byte_idx] >> bit_idx) & 1
-            yield tuple(col)
+                word = _load_word(data + r * (pitch >> 3), block >> 6, n)
+                for j in range(width):
+                    cells[j * t + r] = (word >> j) & 1
+            for j in range(width):
+                yield tuple(block_cols[j * t:(j + 1) * t])
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        _fill_matrix_buffer(self, self._cff, buffer, flags, True)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        _release_matrix_buffer(buffer)
 
 
 cdef class RowsView:
+    """Rows of a CFF, also readable as a (t, n) byte array through the buffer protocol."""
     cdef CFF _cff
 
     def __cinit__(self, CFF cff):
@@ -984,6 +1331,12 @@ cdef class RowsView:
                 bit_offset += 1
             yield tuple(row)
 
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        _fill_matrix_buffer(self, self._cff, buffer, flags, False)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        _release_matrix_buffer(buffer)
+
 
 cdef class PoolsView:
     cdef CFF _cff
@@ -994,10 +1347,9 @@ cdef class PoolsView:
     def __len__(self):
         return self._cff._t
 
-    def __getitem__(self, int r):
-        cdef int c, bit_offset, byte_idx, bit_idx
-        cdef int n = self._cff._n
-        cdef int pitch = self._cff._row_pitch_bits
+    def __getitem__(self, Py_ssize_t r):
+        cdef Py_ssize_t n = self._cff._n
+        cdef Py_ssize_t pitch = self._cff._row_pitch_bits
         cdef const unsigned char* data = self._cff._matrix
 
         if r < 0:
@@ -1006,35 +1358,17 @@ cdef class PoolsView:
         if r < 0 or r >= self._cff._t:
             raise IndexError('Pool index out of range')
 
-        result = []
-        bit_offset = r * pitch
-        for c in range(n):
-            byte_idx = bit_offset >> 3
-            bit_idx = bit_offset & 7
-            if (data[byte_idx] >> bit_idx) & 1:
-                result.append(c)
-            bit_offset += 1
-
-        return tuple(result)
+        return _row_pool(data, r, n, pitch)
 
     def __iter__(self):
-        cdef int r, c
-        cdef int bit_offset, byte_idx, bit_idx
-        cdef int t = self._cff._t
-        cdef int n = self._cff._n
-        cdef int pitch = self._cff._row_pitch_bits
+        cdef Py_ssize_t r
+        cdef Py_ssize_t t = self._cff._t
+        cdef Py_ssize_t n = self._cff._n
+        cdef Py_ssize_t pitch = self._cff._row_pitch_bits
         cdef const unsigned char* data = self._cff._matrix
 
         for r in range(t):
-            result = []
-            bit_offset = r * pitch
-            for c in range(n):
-                byte_idx = bit_offset >> 3
-                bit_idx = bit_offset & 7
-                if (data[byte_idx] >> bit_idx) & 1:
-                    result.append(c)
-                bit_offset += 1
-            yield tuple(result)
+            yield _row_pool(data, r, n, pitch)
 
 
 cdef class SubsetsView:
@@ -1066,22 +1400,31 @@ cdef class SubsetsView:
         return tuple(result)
 
     def __iter__(self):
-        cdef int r, c
-        cdef int bit_offset, byte_idx, bit_idx
-        cdef int t = self._cff._t
-        cdef int n = self._cff._n
-        cdef int pitch = self._cff._row_pitch_bits
+        cdef Py_ssize_t r, c, j, block, width
+        cdef Py_ssize_t t = self._cff._t
+        cdef Py_ssize_t n = self._cff._n
+        cdef Py_ssize_t pitch = self._cff._row_pitch_bits
         cdef const unsigned char* data = self._cff._matrix
+        cdef unsigned long long word
+        cdef list block_subsets
 
-        for c in range(n):
-            result = []
+        if pitch & 7:
+            for c in range(n):
+                yield self[c]
+            return
+
+        # Collect 64 subsets at a time with one pass down the rows,
+        # jumping straight to the set bits of each row's 64-bit word
+        for block in range(0, n, 64):
+            width = min(64, n - block)
+            block_subsets = [[] for j in range(width)]
             for r in range(t):
-                bit_offset = r * pitch + c
-                byte_idx = bit_offset >> 3
-                bit_idx = bit_offset & 7
-                if (data[byte_idx] >> bit_idx) & 1:
-                    result.append(r)
-            yield tuple(result)
+                word = _load_word(data + r * (pitch >> 3), block >> 6, n)
+                while word:
+                    (<list>block_subsets[__builtin_ctzll(word)]).append(r)
+                    word &= word - 1
+            for j in range(width):
+                yield tuple(block_subsets[j])
 
 
 cdef class CFFTable:
@@ -1128,7 +1471,8 @@ cdef class CFFTable:
         self._d_maximum = d_max
         self._t_maximum = t_max
         self._n_maximum = n_max
-        self._c_cff_table_ctx = cff_table_create(d_max, t_max, n_max)
+        with nogil:
+            self._c_cff_table_ctx = cff_table_create(d_max, t_max, n_max)
         if self._c_cff_table_ctx == NULL:
             raise MemoryError('Failed to allocate CFFTable')
 
@@ -1206,12 +1550,13 @@ cdef class CFFTable:
         CFF
             A CFF with the desired d and t, with maximum n from our constructions
         """
-        if d > self.d_max or t > self.t_max or t < 1 or d < 1:
+        if d > self._d_maximum or t > self._t_maximum or t < 1 or d < 1:
             raise ValueError(
-            f'Invalid parameters: d must be in [1, {self.d_max}] and '
-            f't must be in [1, {self.t_max}], got d={d}, t={t}')
+            f'Invalid parameters: d must be in [1, {self._d_maximum}] and '
+            f't must be in [1, {self._t_maximum}], got d={d}, t={t}')
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_table_get_by_t(self._c_cff_table_ctx, d, t)
+        with nogil:
+            result._c_cff = cff_table_get_by_t(self._c_cff_table_ctx, d, t)
         if result._c_cff == NULL:
             raise ValueError('CFF not in table, or memory allocation failed (cff_table_get_by_t returned NULL).'
                             'Try making a new table with larger n_max.')
@@ -1248,12 +1593,13 @@ cdef class CFFTable:
         CFF
             A CFF with the desired t and n, possibly with n larger, and minimum t from our constructions, or None on failure
         """
-        if d > self.d_max or n > self.n_max or n < 1 or d < 1:
+        if d > self._d_maximum or n > self._n_maximum or n < 1 or d < 1:
             raise ValueError(
-            f'Invalid parameters: d must be in [1, {self.d_max}] and '
-            f'n must be in [1, {self.n_max}], got d={d}, n={n}')
+            f'Invalid parameters: d must be in [1, {self._d_maximum}] and '
+            f'n must be in [1, {self._n_maximum}], got d={d}, n={n}')
         cdef CFF result = CFF.__new__(CFF)
-        result._c_cff = cff_table_get_by_n(self._c_cff_table_ctx, d, n)
+        with nogil:
+            result._c_cff = cff_table_get_by_n(self._c_cff_table_ctx, d, n)
         if result._c_cff == NULL:
             raise ValueError('CFF not in table, or memory allocation failed (cff_table_get_by_n returned NULL).'
                             'Try making a new table with larger t_max.')
@@ -0,0 +1,20 @@
+import pytest
+from pycfftables import CFF, CFFTable
+
+# Shared objects are built once per session. Tests must not modify them; use .copy() first.
+
+@pytest.fixture(scope="session")
+def small_table():
+    return CFFTable(2, 100, 1000)
+
+@pytest.fixture(scope="session")
+def big_table():
+    return CFFTable(3, 200, 50000)
+
+@pytest.fixture(scope="session")
+def sts9():
+    return CFF.sts(9)
+
+@pytest.fixture(scope="session")
+def sts13():
+    return CFF.sts(13)
@@ -1,19 +1,88 @@
+import hashlib
+import struct
+
 import pytest
 from pycfftables import CFF, CFFTable
 
-def test_views_len():
-    cff = CFF.sts(13)
+def test_views_len(sts13):
+    cff = sts13
     assert len(cff.rows) == 13
     assert len(cff.cols) == 26
     assert len(cff.pools) == 13
     assert len(cff.subsets) == 26
 
-def test_rows_pools():
-    cff = CFF.sts(13)
+def test_rows_pools(sts13):
+    cff = sts13
     for i in range(len(cff.rows)):
         assert len(cff.pools[i]) == sum(cff.rows[i])
 
-def test_cols_subsets():
-    cff = CFF.sts(13)
+def test_cols_subsets(sts13):
+    cff = sts13
+    for i in range(len(cff.cols)):
+        assert len(cff.subsets[i]) == sum(cff.cols[i])
+
+def test_weights(sts13):
+    cff = sts13.copy()
+    assert len(cff.row_weights) == 13
+    assert len(cff.col_weights) == 26
+    for i in range(len(cff.rows)):
+        assert len(cff.pools[i]) == cff.row_weights[i]
     for i in range(len(cff.cols)):
-        assert len(cff.subsets[i]) == sum(cff.cols[i])
\ No newline at end of file
+        assert len(cff.subsets[i]) == cff.col_weights[i]
+    cff[0, 0] = 1 - cff[0, 0]
+    assert cff.row_weights[0] == sum(cff.rows[0])
+    assert cff.col_weights[0] == sum(cff.cols[0])
+
+def test_weights_release(sts13):
+    # releasing one caller's view must not affect the next access
+    with sts13.row_weights as weights:
+        first = weights[0]
+    sts13.col_weights.release()
+    assert sts13.row_weights[0] == first
+    assert sts13.col_weights[0] == len(sts13.subsets[0])
+
+def test_rows_cols_buffer(sts13):
+    cff = sts13
+    rows = memoryview(cff.rows)
+    assert rows.shape == (13, 26)
+    assert rows.readonly
+    assert [tuple(row) for row in rows.tolist()] == list(cff.rows)
+    cols = memoryview(cff.cols)
+    assert cols.shape == (26, 13)
+    assert [tuple(col) for col in cols.tolist()] == list(cff.cols)
+
+def test_rows_buffer_consumer_errors(sts13):
+    # errors raised by a consumer must come through unchanged after the buffer is released
+    with pytest.raises(struct.error):
+        struct.unpack('i', sts13.rows)
+    with pytest.raises(ValueError):
+        with memoryview(sts13.rows) as rows:
+            raise ValueError('raised while holding the buffer')
+
+def test_rows_buffer_simple(sts13):
+    # consumers asking for a plain 1-D buffer get the unpacked matrix as bytes
+    rows = bytes(memoryview(sts13.rows).cast('B'))
+    assert hashlib.md5(sts13.rows).digest() == hashlib.md5(rows).digest()
+
+def wide_cff():
+    # more than one 64-bit word per row, with a partial last word
+    cff = CFF.all_zeros(2, 5, 130)
+    for r in range(5):
+        for c in range(r, 130, r + 2):
+            cff[r, c] = 1
+    return cff
+
+def test_pools_weights_wide():
+    cff = wide_cff()
+    for r in range(5):
+        assert cff.pools[r] == tuple(c for c in range(130) if cff[r, c])
+        assert cff.row_weights[r] == len(cff.pools[r])
+    assert list(cff.pools) == [cff.pools[r] for r in range(5)]
+
+def test_cols_subsets_wide():
+    # iteration unpacks 64 columns at a time, check every cell across several blocks
+    cff = wide_cff()
+    assert list(cff.cols) == [tuple(cff[r, c] for r in range(5)) for c in range(130)]
+    assert list(cff.subsets) == [tuple(r for r in range(5) if cff[r, c]) for c in range(130)]
+    assert list(cff.cols) == [cff.cols[c] for c in range(130)]
+    assert list(cff.subsets) == [cff.subsets[c] for c in range(130)]
\ No newline at end of file
@@ -20,6 +20,11 @@ def test_identity():
     assert cff.verify()
     print(cff)
 
+def test_to_string():
+    cff = CFF.identity(1, 3)
+    assert repr(cff) == '1-CFF(3,3)'
+    assert str(cff) == cff.to_string() == '1-CFF(3,3):\n1 - -\n- 1 -\n- - 1'
+
 def test_sperner():
     cff = CFF.sperner(10)
     assert cff
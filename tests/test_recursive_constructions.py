@@ -1,32 +1,26 @@
 import pytest
 from pycfftables import CFF, CFFTable
 
-def test_ext_by_one():
-    initial_cff = CFF.sts(9)
-    cff = CFF.extend_by_one(initial_cff)
+def test_ext_by_one(sts9):
+    cff = CFF.extend_by_one(sts9)
     assert cff
     assert cff.verify()
     print(cff)
 
-def test_doubling():
-    initial_cff = CFF.sts(9)
-    cff = CFF.double(initial_cff)
+def test_doubling(sts9):
+    cff = CFF.double(sts9)
     assert cff
     assert cff.verify()
     print(cff)
 
-def test_additive():
-    left = CFF.sts(9)
-    right = CFF.sts(13)
-    cff = CFF.add(left, right)
+def test_additive(sts9, sts13):
+    cff = CFF.add(sts9, sts13)
     assert cff
     assert cff.verify()
     print(cff)
 
-def test_kronecker():
-    left = CFF.sts(9)
-    right = CFF.sts(13)
-    cff = CFF.kronecker(left, right)
+def test_kronecker(sts9, sts13):
+    cff = CFF.kronecker(sts9, sts13)
     assert cff
     assert cff.verify()
     print(cff)
\ No newline at end of file